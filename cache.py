@@ -0,0 +1,99 @@
+"""Persistent cache for Spotify lookups that survives app restarts.
+
+Entries go to Redis when REDIS_HOST is set, otherwise to a local SQLite
+file. Redis support needs the optional redis package, which is not in
+requirements.txt; without it the cache logs a warning once and uses
+SQLite. Values are stored as JSON. Backend errors are treated as cache
+misses so a broken cache never breaks a lookup.
+"""
+import os
+import json
+import logging
+import time
+import asyncio
+import sqlite3
+import threading
+
+REDIS_HOST = os.getenv("REDIS_HOST")
+REDIS_PORT = int(os.getenv("REDIS_PORT", "6379"))
+CACHE_PATH = os.getenv("CACHE_PATH", ".harmony_cache.sqlite")
+
+logger = logging.getLogger(__name__)
+
+
+class _SQLiteBackend:
+    """Queries run in worker threads so disk I/O never blocks the event loop"""
+
+    def __init__(self, path):
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS cache (key TEXT PRIMARY KEY, value TEXT, expires REAL)"
+        )
+        self._lock = threading.Lock()
+
+    def _get(self, key):
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT value FROM cache WHERE key = ? AND expires > ?", (key, time.time())
+            ).fetchone()
+        return row[0] if row else None
+
+    def _set(self, key, value, ttl):
+        now = time.time()
+        with self._lock, self._conn:
+            self._conn.execute("DELETE FROM cache WHERE expires <= ?", (now,))
+            self._conn.execute(
+                "INSERT OR REPLACE INTO cache (key, value, expires) VALUES (?, ?, ?)",
+                (key, value, now + ttl)
+            )
+
+    async def get(self, key):
+        return await asyncio.to_thread(self._get, key)
+
+    async def set(self, key, value, ttl):
+        await asyncio.to_thread(self._set, key, value, ttl)
+
+
+class _RedisBackend:
+    def __init__(self, host, port):
+        import redis.asyncio as redis
+        self._client = redis.Redis(host=host, port=port)
+
+    async def get(self, key):
+        return await self._client.get(key)
+
+    async def set(self, key, value, ttl):
+        await self._client.set(key, value, ex=ttl)
+
+
+_backend = None
+
+
+def _get_backend():
+    global _backend
+    if _backend is None and REDIS_HOST:
+        try:
+            _backend = _RedisBackend(REDIS_HOST, REDIS_PORT)
+        except ImportError:
+            logger.warning("REDIS_HOST is set but the redis package is not installed; "
+                           "caching to %s instead", CACHE_PATH)
+    if _backend is None:
+        _backend = _SQLiteBackend(CACHE_PATH)
+    return _backend
+
+
+async def get(key):
+    """Return the cached value for key, or None if missing or expired"""
+    try:
+        value = await _get_backend().get(key)
+    except Exception:
+        return None
+    return json.loads(value) if value is not None else None
+
+
+async def set(key, value, ttl):
+    """Store a JSON-serialisable value under key for ttl seconds"""
+    try:
+        await _get_backend().set(key, json.dumps(value), ttl)
+    except Exception:
+        pass
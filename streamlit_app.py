@@ -1,10 +1,479 @@
 import os
+import time
+import base64
+import asyncio
+import hashlib
+import html
+import functools
+import threading
+import aiohttp
+import orjson
 import streamlit as st
-import requests
-import spotipy
 import datetime
-from spotipy.oauth2 import SpotifyClientCredentials
-from urllib.parse import quote, quote_plus
+from string import Template
+from urllib.parse import quote_plus
+import cache
+
+SPOTIFY_API_URL = "https://api.spotify.com/v1"
+SPOTIFY_TOKEN_URL = "https://accounts.spotify.com/api/token"
+TOKEN_REFRESH_MARGIN = 60  # seconds before expiry to fetch a new token
+SPOTIFY_BATCH_SIZE = 50  # maximum IDs accepted by /v1/tracks
+TRACK_QUERY_TEMPLATE = 'track:"{track}" artist:"{artist}"'
+ARTIST_QUERY_TEMPLATE = 'artist:"{artist}"'
+TRACK_TTL = 86400
+PREVIEW_TTL = 300  # preview URLs expire well before the track metadata
+COVER_MIN_WIDTH = 300  # px; Spotify usually offers 640, 300 and 64
+PLACEHOLDER_COVER = "data:image/svg+xml;base64," + base64.b64encode(
+    b'<svg xmlns="http://www.w3.org/2000/svg" width="400" height="400" viewBox="0 0 400 400">'
+    b'<rect width="400" height="400" fill="#333"/>'
+    b'<text x="200" y="200" fill="#aaa" font-family="sans-serif" font-size="28" '
+    b'text-anchor="middle" dominant-baseline="middle">No Album Cover</text></svg>'
+).decode()
+
+HTTP_POOL_SIZE = 10
+HTTP_CONNECT_TIMEOUT = 1.0  # seconds
+HTTP_READ_TIMEOUT = 4.0  # seconds
+HTTP_TOTAL_TIMEOUT = 5.0  # seconds, per attempt
+HTTP_RETRIES = 2
+HTTP_BACKOFF = 0.2  # seconds, doubled after each retry
+RECOMMENDATION_MAX_BYTES = 65536  # the API answers with a single short JSON object
+
+SPOTIFY_EMBED_TEMPLATE = Template(
+    '<iframe src="https://open.spotify.com/embed/track/$id" width="300" height="80" '
+    'frameborder="0" allowtransparency="true" allow="encrypted-media"></iframe>'
+)
+
+BACKGROUND_CSS = """
+<style>
+.stApp {
+    background: url(https://images.pexels.com/photos/1763075/pexels-photo-1763075.jpeg) no-repeat center center fixed;
+    background-size: cover;
+}
+.stApp::before {
+    content: "";
+    position: fixed;
+    top: 0;
+    left: 0;
+    width: 100%;
+    height: 100%;
+    background: rgba(0, 0, 0, 0.6);
+    z-index: -1;
+}
+</style>
+"""
+
+TITLE_HTML = """
+<link href="https://fonts.googleapis.com/css2?family=Metamorphous&display=swap" rel="stylesheet">
+<style>
+.title-container {
+    width: 100%;
+    display: flex !important;
+    justify-content: center !important;
+}
+.main-title {
+    font-size: 4rem !important;
+    font-family: 'Metamorphous', serif !important;
+    color: #2A0101 !important;  <!-- Forced color -->
+    text-align: center !important;
+    margin: 3rem 0 !important;
+    font-weight: 900 !important;
+    text-shadow: 
+        0 2px 4px rgba(0, 0, 0, 0.3) !important;
+    background: linear-gradient(
+        to bottom right,
+        rgba(255, 255, 255, 0.15),
+        rgba(255, 255, 255, 0.05)
+    ) !important;
+    padding: 12px 24px !important;
+    border-radius: 6px !important;
+    border: 1px solid rgba(42, 1, 1, 0.2) !important;
+}
+</style>
+<div class="title-container">
+    <h1 class="main-title">Harmony Guide</h1>
+</div>
+"""
+
+INPUT_CSS = """
+<style>
+.stTextInput > div > div > input {
+    font-size: 18px;
+    padding: 12px;
+    border-radius: 6px;
+    border: 2px solid #FF6666;
+    background: rgba(50, 50, 50, 0.7);
+    color: #FFFFFF;
+}
+.stTextInput > div > div > input::placeholder {
+    color: rgba(255, 200, 200, 0.6);
+    font-style: italic;
+}
+.stTextInput input {
+    background: rgba(255, 204, 204, 0.15) !important;
+    border: 2px solid #CD3232 !important;
+    color: white !important;
+    border-radius: 6px;
+    padding: 12px;
+}
+div.stButton > button, div.stFormSubmitButton > button {
+    display: block;
+    margin: 0 auto;
+}
+.stButton>button, .stFormSubmitButton>button {
+    background: #CD3232 !important;
+    color: white !important;
+    border: none;
+    border-radius: 8px;
+    padding: 12px 24px;
+    font-weight: bold;
+    transition: all 0.3s;
+}
+.stButton>button:hover, .stFormSubmitButton>button:hover {
+    transform: scale(1.05);
+    box-shadow: 0 0 15px #CD3232;
+}
+</style>
+"""
+
+LAYOUT_CSS = """
+<style>
+.main {
+    max-width: 800px;
+    margin: 0 auto;
+}
+</style>
+"""
+
+CSS_BUNDLE = BACKGROUND_CSS + TITLE_HTML + INPUT_CSS + LAYOUT_CSS
+
+SERVICE_LINK_CSS = """
+<style>
+.service-link {
+    padding: 0.5rem;
+    border-radius: 4px;
+    margin: 0.3rem 0;
+    background: rgba(255,255,255,0.1);
+    transition: all 0.3s;
+}
+.service-link:hover {
+    background: rgba(255,255,255,0.2);
+}
+</style>
+"""
+
+SERVICE_LINK_TEMPLATE = """
+<div>
+<a href="{url}" target="_blank" class="service-link">
+    🎧 {service} → 
+    <span style="float: right; color: #888; font-size: 0.9rem;">
+        {short}
+    </span>
+</a>
+</div>
+"""
+
+
+class SpotifyClient:
+    """Client-credentials access to the Spotify Web API"""
+
+    def __init__(self, client_id, client_secret):
+        credentials = base64.b64encode(f"{client_id}:{client_secret}".encode()).decode()
+        self._auth_header = {"Authorization": f"Basic {credentials}"}
+        self._token = None
+        self._expires_at = 0.0
+        self._lock = asyncio.Lock()
+
+    async def token(self, session, refresh=False):
+        """Bearer token, fetched again shortly before it expires or on request"""
+        async with self._lock:
+            if refresh or self._token is None or time.monotonic() >= self._expires_at:
+                async with session.post(SPOTIFY_TOKEN_URL, data={"grant_type": "client_credentials"},
+                                        headers=self._auth_header) as response:
+                    response.raise_for_status()
+                    payload = orjson.loads(await response.read())
+                self._token = payload["access_token"]
+                self._expires_at = time.monotonic() + payload["expires_in"] - TOKEN_REFRESH_MARGIN
+            return self._token
+
+
+@st.cache_resource
+def get_spotify_client():
+    """Build the Spotify client once per process from secrets.toml"""
+    return SpotifyClient(
+        client_id=st.secrets["SPOTIPY_CLIENT_ID"],
+        client_secret=st.secrets["SPOTIPY_CLIENT_SECRET"]
+    )
+
+
+@st.cache_resource
+def get_event_loop():
+    """Event loop running in a daemon thread, shared by every session.
+
+    asyncio.run() would close its loop at the end of each rerun, taking the
+    cached aiohttp session down with it, so coroutines are submitted here.
+    """
+    loop = asyncio.new_event_loop()
+    threading.Thread(target=loop.run_forever, daemon=True).start()
+    return loop
+
+
+def run_async(coro):
+    """Run a coroutine on the shared event loop and wait for its result"""
+    return asyncio.run_coroutine_threadsafe(coro, get_event_loop()).result()
+
+
+@st.cache_resource
+def get_http_session():
+    """Shared aiohttp session, created on the shared event loop"""
+    async def _create():
+        return aiohttp.ClientSession(
+            connector=aiohttp.TCPConnector(limit=HTTP_POOL_SIZE, limit_per_host=HTTP_POOL_SIZE),
+            timeout=aiohttp.ClientTimeout(total=HTTP_TOTAL_TIMEOUT, sock_connect=HTTP_CONNECT_TIMEOUT,
+                                          sock_read=HTTP_READ_TIMEOUT)
+        )
+    return run_async(_create())
+
+
+async def _read_body(response, max_bytes=None):
+    """Read the response body, failing as soon as it grows past max_bytes"""
+    if max_bytes is None:
+        return await response.read()
+    if response.content_length is not None and response.content_length > max_bytes:
+        raise aiohttp.ClientPayloadError(f"Response larger than {max_bytes} bytes")
+
+    body = bytearray()
+    async for chunk in response.content.iter_chunked(8192):
+        body += chunk
+        if len(body) > max_bytes:
+            raise aiohttp.ClientPayloadError(f"Response larger than {max_bytes} bytes")
+    return bytes(body)
+
+
+async def _get_json(session, url, max_bytes=None, retry_on=(aiohttp.ClientConnectionError, asyncio.TimeoutError),
+                    **kwargs):
+    """GET url and decode the JSON body, retrying retry_on errors with backoff"""
+    for attempt in range(HTTP_RETRIES + 1):
+        try:
+            async with session.get(url, **kwargs) as response:
+                response.raise_for_status()
+                body = await _read_body(response, max_bytes)
+            try:
+                return orjson.loads(body)
+            except orjson.JSONDecodeError as e:
+                raise aiohttp.ClientPayloadError(f"Invalid JSON response: {e}") from e
+        except retry_on:
+            if attempt == HTTP_RETRIES:
+                raise
+            await asyncio.sleep(HTTP_BACKOFF * 2 ** attempt)
+
+
+def _album_cover(images):
+    """Smallest cover that still fills the column; Spotify lists largest first"""
+    if not images:
+        return None
+    return next((image['url'] for image in reversed(images)
+                 if (image.get('width') or 0) >= COVER_MIN_WIDTH), images[-1]['url'])
+
+
+def _track_info(track):
+    """Reduce a Spotify track object to the fields the UI uses"""
+    return {
+        'track_name': track['name'],
+        'preview_url': track.get('preview_url'),
+        'explicit': track.get('explicit', False),
+        'spotify_id': track['id'],
+        'album_cover': _album_cover(track['album']['images']),
+        'release_date': track['album'].get('release_date', ''),
+        'spotify_url': track['external_urls']['spotify']
+    }
+
+
+async def _spotify_get(session, sp, path, params):
+    """GET a Spotify Web API endpoint, refreshing the token once on 401"""
+    url = f"{SPOTIFY_API_URL}/{path}"
+    token = await sp.token(session)
+    try:
+        return await _get_json(session, url, params=params, headers={"Authorization": f"Bearer {token}"})
+    except aiohttp.ClientResponseError as e:
+        if e.status != 401:
+            raise
+    token = await sp.token(session, refresh=True)
+    return await _get_json(session, url, params=params, headers={"Authorization": f"Bearer {token}"})
+
+
+def _track_key(song_name, artist_name):
+    return "track:" + hashlib.sha1(f"{song_name}|{artist_name}".encode()).hexdigest()
+
+
+async def _remember_track(song_name, artist_name, info):
+    """Write track metadata and its preview URL to the persistent cache"""
+    await cache.set(_track_key(song_name, artist_name), info, TRACK_TTL)
+    await cache.set(f"preview:{info['spotify_id']}", {'url': info['preview_url']}, PREVIEW_TTL)
+
+
+async def _search_track(session, sp, song_name, artist_name):
+    """Track lookup served from the persistent cache when possible"""
+    info = await cache.get(_track_key(song_name, artist_name))
+    if info is None:
+        info = await _query_track(session, sp, song_name, artist_name)
+    else:
+        preview = await cache.get(f"preview:{info['spotify_id']}")
+        if preview is not None:
+            return {**info, 'preview_url': preview['url']}
+        # Metadata is still fresh but the preview URL may have expired
+        try:
+            tracks = await _lookup_tracks(session, sp, [info['spotify_id']])
+        except (aiohttp.ClientError, asyncio.TimeoutError):
+            return {**info, 'preview_url': None}
+        info = tracks.get(info['spotify_id'], info)
+
+    if info is not None:
+        await _remember_track(song_name, artist_name, info)
+    return info
+
+
+def _search_term(value):
+    """Drop double quotes, which would end a quoted field filter early"""
+    return value.replace('"', '')
+
+
+async def _query_track(session, sp, song_name, artist_name):
+    """Direct track lookup using Spotify's advanced search syntax"""
+    song_name, artist_name = _search_term(song_name), _search_term(artist_name)
+    query = TRACK_QUERY_TEMPLATE.format(track=song_name, artist=artist_name)
+    results = await _spotify_get(session, sp, "search", {"q": query, "type": "track", "limit": 1})
+
+    if not results['tracks']['items']:
+        # Fall back to a free-text search for near misses in title or artist
+        results = await _spotify_get(session, sp, "search",
+                                     {"q": f"{song_name} {artist_name}", "type": "track", "limit": 1})
+        if not results['tracks']['items']:
+            return None
+    return _track_info(results['tracks']['items'][0])
+
+
+async def _search_tracks(session, sp, pairs, timeout=None):
+    """Look up several (song, artist) pairs with as few Spotify requests as possible.
+
+    Pairs already in the persistent cache only need an expired preview URL
+    refreshed, which costs one /v1/tracks request per SPOTIFY_BATCH_SIZE
+    tracks; the remaining pairs are searched concurrently. Returns the
+    results, with None for searches that failed or were still running after
+    timeout seconds, and the errors raised by failed searches.
+    """
+    pairs = list(dict.fromkeys(pairs))
+    cached = await asyncio.gather(*(cache.get(_track_key(*pair)) for pair in pairs))
+    hits = {pair: info for pair, info in zip(pairs, cached) if info is not None}
+    previews = await asyncio.gather(*(cache.get(f"preview:{info['spotify_id']}") for info in hits.values()))
+
+    results, stale = {}, {}
+    for (pair, info), preview in zip(hits.items(), previews):
+        if preview is not None:
+            results[pair] = {**info, 'preview_url': preview['url']}
+        else:
+            stale[pair] = info
+
+    if stale:
+        try:
+            tracks = await _lookup_tracks(session, sp, [info['spotify_id'] for info in stale.values()])
+        except (aiohttp.ClientError, asyncio.TimeoutError):
+            tracks = {}
+        for pair, info in stale.items():
+            fresh = tracks.get(info['spotify_id'])
+            if fresh is None:
+                results[pair] = {**info, 'preview_url': None}
+            else:
+                await _remember_track(*pair, fresh)
+                results[pair] = fresh
+
+    tasks = {pair: asyncio.ensure_future(_search_track(session, sp, *pair))
+             for pair in pairs if pair not in hits}
+    errors = []
+    if tasks:
+        done, pending = await asyncio.wait(tasks.values(), timeout=timeout)
+        for task in pending:
+            task.cancel()
+        for pair, task in tasks.items():
+            if task in done and task.exception() is not None:
+                errors.append(task.exception())
+            results[pair] = task.result() if task in done and task.exception() is None else None
+    return results, errors
+
+
+async def _lookup_tracks(session, sp, track_ids):
+    """Fetch tracks by Spotify ID, up to SPOTIFY_BATCH_SIZE per request"""
+    batches = [track_ids[i:i + SPOTIFY_BATCH_SIZE]
+               for i in range(0, len(track_ids), SPOTIFY_BATCH_SIZE)]
+    responses = await asyncio.gather(*(
+        _spotify_get(session, sp, "tracks", {"ids": ",".join(batch)}) for batch in batches
+    ))
+    return {track['id']: _track_info(track)
+            for response in responses for track in response['tracks'] if track}
+
+
+async def _search_artist_tracks(session, sp, artist_name):
+    """Speculatively fetch the artist's top tracks; best effort only"""
+    try:
+        results = await _spotify_get(session, sp, "search",
+                                     {"q": ARTIST_QUERY_TEMPLATE.format(artist=_search_term(artist_name)),
+                                      "type": "track", "limit": 10})
+        return results['tracks']['items']
+    except Exception:
+        return []
+
+
+async def _request_recommendation(session, api_url, artist_name):
+    """Ask the recommendation API for a song by the given artist"""
+    # Only retry when the request never reached the API: every call runs a
+    # fuzzy match server-side, so retrying read timeouts multiplies the load
+    result = await _get_json(session, api_url, max_bytes=RECOMMENDATION_MAX_BYTES,
+                             retry_on=(aiohttp.ClientConnectorError,),
+                             params={"artist_name": artist_name})
+    return result['recommended_song'].split(": ")[-1]
+
+
+async def _recommend(session, sp, api_url, artist_name):
+    """Fetch a recommendation while searching the artist's tracks in parallel.
+
+    Returns the recommended song and, if it was among the speculatively
+    fetched tracks, its track info; otherwise None for the track info.
+    """
+    song_name, candidates = await asyncio.gather(
+        _request_recommendation(session, api_url, artist_name),
+        _search_artist_tracks(session, sp, artist_name)
+    )
+    for track in candidates:
+        if track['name'].casefold() == song_name.casefold():
+            info = _track_info(track)
+            await _remember_track(song_name, artist_name, info)
+            return song_name, info
+    return song_name, None
+
+
+@st.cache_data(ttl=PREVIEW_TTL, max_entries=1024, show_spinner=False)
+def _fetch_track(song_name, artist_name, _sp):
+    """Search Spotify for a single track; cached per (song, artist) pair."""
+    return run_async(_search_track(get_http_session(), _sp, song_name, artist_name))
+
+
+@st.cache_data(ttl=PREVIEW_TTL, max_entries=1024, show_spinner=False)
+def _fetch_recommendation(api_url, artist_name, _sp):
+    """Recommended song for the artist plus its track info when already known."""
+    return run_async(_recommend(get_http_session(), _sp, api_url, artist_name))
+
+
+@functools.lru_cache(maxsize=256)
+def _build_alt_urls(song_name, artist_name, spotify_id=None):
+    """(service, url) pairs for other platforms, as a tuple so it can be cached"""
+    base_query = quote_plus(f"{song_name} {artist_name}")
+    return (
+        ('Spotify Direct', f"https://open.spotify.com/track/{spotify_id}" if spotify_id else
+         f"https://open.spotify.com/search/{base_query}"),
+        ('YouTube Music', f"https://music.youtube.com/search?q={base_query}"),
+        ('SoundCloud', f"https://soundcloud.com/search?q={base_query}"),
+        ('Deezer', f"https://www.deezer.com/search/{base_query}")
+    )
+
 
 class MusicRecommender:
     def __init__(self):
@@ -15,12 +484,7 @@ class MusicRecommender:
     def _init_spotify_client(self):
         """Initialize Spotify client with secrets from secrets.toml"""
         try:
-            client_id = st.secrets["SPOTIPY_CLIENT_ID"]
-            client_secret = st.secrets["SPOTIPY_CLIENT_SECRET"]
-            self.sp = spotipy.Spotify(auth_manager=SpotifyClientCredentials(
-                client_id=client_id,
-                client_secret=client_secret
-            ))
+            self.sp = get_spotify_client()
         except KeyError as e:
             st.error(f"Missing secret: {str(e)}")
             st.stop()
@@ -28,49 +492,60 @@ class MusicRecommender:
             st.error(f"Failed to initialize Spotify client: {str(e)}")
             st.stop()
 
+    @staticmethod
+    @functools.lru_cache(maxsize=512)
     def get_spotify_embed(track_id):
         """Returns the HTML for embedding a Spotify player."""
-        embed_html = f"""
-        <iframe src="https://open.spotify.com/embed/track/{track_id}" width="300" height="80" frameborder="0" allowtransparency="true" allow="encrypted-media"></iframe>
-        """
-        return embed_html
+        return SPOTIFY_EMBED_TEMPLATE.substitute(id=track_id)
+
     def get_song_info(self, song_name, artist_name):
         """Direct track lookup with explicit preview checks"""
         try:
-            # Use Spotify's advanced search syntax
-            query = f'track:"{song_name}" artist:"{artist_name}"'
-            results = self.sp.search(q=query, limit=1, type='track')
-
-            if not results['tracks']['items']:
-                return None
-
-            track = results['tracks']['items'][0]
-            return {
-                'preview_url': track.get('preview_url'),
-                'explicit': track.get('explicit', False),
-                'spotify_id': track['id'],
-                'album_cover': track['album']['images'][0]['url'] if track['album']['images'] else None,
-                'release_date': track['album'].get('release_date', ''),
-                'spotify_url': track['external_urls']['spotify']
-            }
-
+            return _fetch_track(song_name, artist_name, self.sp)
         except Exception as e:
             st.error(f"Track lookup error: {str(e)}")
             return None
 
-    def display_recommendation(self, song_name, artist_name):
-        """Enhanced display with preview troubleshooting"""
-        with st.spinner("🔍 Deep searching across multiple sources..."):
-            track_info = self.get_song_info(song_name, artist_name)
+    def get_songs_info(self, pairs, max_wait_ms=None):
+        """Batch lookup of (song, artist) pairs through the persistent cache.
+
+        Pairs still pending after max_wait_ms come back as None so the
+        caller can render what has arrived and ask again for the rest.
+        """
+        timeout = max_wait_ms / 1000 if max_wait_ms is not None else None
+        try:
+            results, errors = run_async(_search_tracks(get_http_session(), self.sp, list(pairs), timeout))
+        except Exception as e:
+            st.error(f"Track lookup error: {str(e)}")
+            return {}
+        if errors:
+            st.error(f"Track lookup error: {str(errors[0])}")
+        return results
+
+    def get_tracks_info(self, track_ids):
+        """Batch lookup by Spotify ID, one request per 50 tracks"""
+        try:
+            return run_async(_lookup_tracks(get_http_session(), self.sp, list(track_ids)))
+        except Exception as e:
+            st.error(f"Track lookup error: {str(e)}")
+            return {}
+
+    def display_recommendation(self, song_name, artist_name, track_info=None):
+        """Enhanced display with preview troubleshooting; returns the track info shown"""
+        if track_info is None:
+            with st.spinner("🔍 Deep searching across multiple sources..."):
+                track_info = self.get_song_info(song_name, artist_name)
 
         col1, col2 = st.columns([1, 2])
 
         with col1:
             # Handle album art display
             cover_url = track_info.get('album_cover') if track_info else None
-            st.image(cover_url or "https://via.placeholder.com/400x400.png?text=No+Album+Cover",
-                     use_container_width=True,
-                     caption=track_info.get('track_name', ''))
+            caption = track_info.get('track_name', song_name) if track_info else song_name
+            st.markdown(
+                f'<img loading="lazy" decoding="async" src="{html.escape(cover_url or PLACEHOLDER_COVER)}" '
+                f'style="width: 100%; border-radius: 8px;" alt="{html.escape(caption)}"/>',
+                unsafe_allow_html=True)
 
         with col2:
             # Quality indicator
@@ -106,185 +581,50 @@ class MusicRecommender:
                 </div>
                 """, unsafe_allow_html=True)
 
+        return track_info
+
     def _show_alternatives(self, song_name, artist_name, spotify_id=None):
         """Service-specific URL formatting with proper encoding"""
-        base_query = f"{song_name} {artist_name}"
-
-        # Create platform-specific URLs
-        urls = {
-            'Spotify Direct': f"https://open.spotify.com/track/{spotify_id}" if spotify_id else
-            f"https://open.spotify.com/search/{quote(base_query)}",
-            'YouTube Music': f"https://music.youtube.com/search?q={quote_plus(base_query)}",
-            'SoundCloud': f"https://soundcloud.com/search?q={quote_plus(base_query)}",
-            'Deezer': f"https://www.deezer.com/search/{quote(base_query)}"
-        }
-
         with st.expander("🔊 Alternative Listening Options", expanded=True):
-            st.markdown("""
-                   <style>
-                   .service-link {
-                       padding: 0.5rem;
-                       border-radius: 4px;
-                       margin: 0.3rem 0;
-                       background: rgba(255,255,255,0.1);
-                       transition: all 0.3s;
-                   }
-                   .service-link:hover {
-                       background: rgba(255,255,255,0.2);
-                   }
-                   </style>
-               """, unsafe_allow_html=True)
-
-            for service, url in urls.items():
-                st.markdown(f"""
-                       <a href="{url}" target="_blank" class="service-link">
-                           🎧 {service} → 
-                           <span style="float: right; color: #888; font-size: 0.9rem;">
-                               {service.split()[0]}
-                           </span>
-                       </a>
-                   """, unsafe_allow_html=True)
+            links = "".join(SERVICE_LINK_TEMPLATE.format(url=url, service=service, short=service.split()[0])
+                            for service, url in _build_alt_urls(song_name, artist_name, spotify_id))
+            st.markdown(SERVICE_LINK_CSS + links, unsafe_allow_html=True)
 
     def _configure_ui(self):
-        """Configure all UI elements and styles"""
-        self._set_background()
-        self._set_title()
-        self._set_input_style()
-        self._set_main_layout()
-
-    def _set_background(self):
-        """Set background image with overlay"""
-        bg_image = "https://images.pexels.com/photos/1763075/pexels-photo-1763075.jpeg"
-        st.markdown(f"""
-            <style>
-            .stApp {{
-                background: url({bg_image}) no-repeat center center fixed;
-                background-size: cover;
-            }}
-            .stApp::before {{
-                content: "";
-                position: fixed;
-                top: 0;
-                left: 0;
-                width: 100%;
-                height: 100%;
-                background: rgba(0, 0, 0, 0.6);
-                z-index: -1;
-            }}
-            </style>
-            """, unsafe_allow_html=True)
-
-    def _set_title(self):
-        """Set custom styled title with enforced color"""
-        st.markdown("""
-           <link href="https://fonts.googleapis.com/css2?family=Metamorphous&display=swap" rel="stylesheet">
-            <style>
-            .title-container {
-                width: 100%;
-                display: flex !important;
-                justify-content: center !important;
-            }
-            .main-title {
-                font-size: 4rem !important;
-                font-family: 'Metamorphous', serif !important;
-                color: #2A0101 !important;  <!-- Forced color -->
-                text-align: center !important;
-                margin: 3rem 0 !important;
-                font-weight: 900 !important;
-                text-shadow: 
-                    0 2px 4px rgba(0, 0, 0, 0.3) !important;
-                background: linear-gradient(
-                    to bottom right,
-                    rgba(255, 255, 255, 0.15),
-                    rgba(255, 255, 255, 0.05)
-                ) !important;
-                padding: 12px 24px !important;
-                border-radius: 6px !important;
-                border: 1px solid rgba(42, 1, 1, 0.2) !important;
-            }
-            </style>
-            <div class="title-container">
-                <h1 class="main-title">Harmony Guide</h1>
-            </div>
-            """, unsafe_allow_html=True)
-
-    def _set_input_style(self):
-        """Style input elements"""
-        st.markdown("""
-            <style>
-            .stTextInput > div > div > input {
-                font-size: 18px;
-                padding: 12px;
-                border-radius: 6px;
-                border: 2px solid #FF6666;
-                background: rgba(50, 50, 50, 0.7);
-                color: #FFFFFF;
-            }
-            .stTextInput > div > div > input::placeholder {
-                color: rgba(255, 200, 200, 0.6);
-                font-style: italic;
-            }
-            .stTextInput input {
-                background: rgba(255, 204, 204, 0.15) !important;
-                border: 2px solid #CD3232 !important;
-                color: white !important;
-                border-radius: 6px;
-                padding: 12px;
-            }
-            div.stButton > button {
-                display: block;
-                margin: 0 auto;
-            }
-            .stButton>button {
-                background: #CD3232 !important;
-                color: white !important;
-                border: none;
-                border-radius: 8px;
-                padding: 12px 24px;
-                font-weight: bold;
-                transition: all 0.3s;
-            }
-            .stButton>button:hover {
-                transform: scale(1.05);
-                box-shadow: 0 0 15px #CD3232;
-            }
-            </style>
-            """, unsafe_allow_html=True)
-
-    def _set_main_layout(self):
-        """Set main content layout"""
-        st.markdown("""
-            <style>
-            .main {
-                max-width: 800px;
-                margin: 0 auto;
-            }
-            </style>
-            """, unsafe_allow_html=True)
+        """Inject all page styles and the title in a single element"""
+        st.markdown(CSS_BUNDLE, unsafe_allow_html=True)
 
     def run(self):
         """Main application flow"""
+        st.session_state.setdefault("last", None)
         st.markdown(
             "<h3 style='text-align: center; color: #ffffff; margin-bottom: 2rem; "
             "text-shadow: 2px 2px 20px rgba(50, 50, 50, 0.8)'>"
             "Discover your next favorite track</h3>",
             unsafe_allow_html=True)
 
-        artist_name = st.text_input("Enter artist name:", key="artist_input")
+        with st.form("recommend_form", clear_on_submit=False):
+            artist_name = st.text_input("Enter artist name:", key="artist_input")
+            submitted = st.form_submit_button("Get Recommendation", type="primary")
 
-        if st.button("Get Recommendation", type="primary"):
-            if not artist_name.strip():
+        if submitted:
+            artist_name = artist_name.strip()
+            if not artist_name:
                 st.warning("Please enter an artist name")
                 return
 
+            last = st.session_state.last
+            if last and last[0] == artist_name and time.monotonic() - last[3] < PREVIEW_TTL:
+                # Same artist as the previous submit and the preview URL is still live
+                self.display_recommendation(last[1], artist_name, last[2])
+                return
+
             try:
-                response = requests.get(f"{self.api_url}?artist_name={artist_name}")
-                response.raise_for_status()
-                result = response.json()
-                recommended_song = result['recommended_song'].split(": ")[-1]
-                self.display_recommendation(recommended_song, artist_name)
+                recommended_song, track_info = _fetch_recommendation(self.api_url, artist_name, self.sp)
+                track_info = self.display_recommendation(recommended_song, artist_name, track_info)
+                st.session_state.last = (artist_name, recommended_song, track_info, time.monotonic())
 
-            except requests.exceptions.RequestException as e:
+            except (aiohttp.ClientError, asyncio.TimeoutError) as e:
                 st.error(f"Recommendation service unavailable: {str(e)}")
             except KeyError:
                 st.error("Unexpected response format from API")